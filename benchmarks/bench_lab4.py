@@ -0,0 +1,216 @@
+import asyncio
+import gc
+import time
+import timeit
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Optional, Tuple
+
+from lab4 import (
+    ListenerDispatcherProtocol,
+    LoopDispatcher,
+    PropertyChangedListenerProtocol,
+    PropertyChangingListenerProtocol,
+    User,
+)
+
+
+class HandWrittenUser:
+    def __init__(self, name: str, age: int) -> None:
+        self._name = name
+        self._age = age
+        self._changed_listeners: List[PropertyChangedListenerProtocol] = []
+        self._changing_listeners: List[PropertyChangingListenerProtocol] = []
+
+    def add_property_changed_listener(self, listener: PropertyChangedListenerProtocol) -> None:
+        self._changed_listeners.append(listener)
+
+    def add_property_changing_listener(self, listener: PropertyChangingListenerProtocol) -> None:
+        self._changing_listeners.append(listener)
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @name.setter
+    def name(self, value: Any) -> None:
+        if self._changing_listeners:
+            allowed = all(
+                listener.on_property_changing(self, "name", self._name, value)
+                for listener in self._changing_listeners
+            )
+            if not allowed:
+                return
+
+        self._name = value
+
+        for listener in self._changed_listeners:
+            listener.on_property_changed(self, "name")
+
+    @property
+    def age(self) -> int:
+        return self._age
+
+    @age.setter
+    def age(self, value: Any) -> None:
+        try:
+            value = int(value)
+        except (ValueError, TypeError):
+            return
+
+        if self._age == value:
+            return
+
+        if self._changing_listeners:
+            allowed: bool = all(
+                listener.on_property_changing(self, "age", self._age, value)
+                for listener in self._changing_listeners
+            )
+            if not allowed:
+                return
+
+        self._age = value
+
+        for listener in self._changed_listeners:
+            listener.on_property_changed(self, "age")
+
+
+class SilentChangedListener(PropertyChangedListenerProtocol):
+    def on_property_changed(self, obj: Any, property_name: str) -> None:
+        pass
+
+
+class SilentAgeValidator(PropertyChangingListenerProtocol):
+    def on_property_changing(self, obj: Any, property_name: str, old_value: int, new_value: int) -> bool:
+        return property_name != "age" or new_value >= 0
+
+
+class SilentNameValidator(PropertyChangingListenerProtocol):
+    def on_property_changing(self, obj: Any, property_name: str, old_value: str, new_value: str) -> bool:
+        return property_name != "name" or len(new_value) >= 2
+
+
+class CountingListener(PropertyChangedListenerProtocol):
+    def __init__(self) -> None:
+        self.count = 0
+
+    def on_property_changed(self, obj: Any, property_name: str) -> None:
+        self.count += 1
+
+
+class PayloadListener(PropertyChangedListenerProtocol):
+    def __init__(self) -> None:
+        self.payload = bytearray(1024 * 1024)
+
+    def on_property_changed(self, obj: Any, property_name: str) -> None:
+        pass
+
+
+CHANGED_LISTENER = SilentChangedListener()
+AGE_VALIDATOR = SilentAgeValidator()
+NAME_VALIDATOR = SilentNameValidator()
+
+
+def make_hand_written_user() -> HandWrittenUser:
+    user = HandWrittenUser("TRAVIS", 34)
+    user.add_property_changed_listener(CHANGED_LISTENER)
+    user.add_property_changing_listener(AGE_VALIDATOR)
+    user.add_property_changing_listener(NAME_VALIDATOR)
+    return user
+
+
+def make_observable_user() -> User:
+    user = User("TRAVIS", 34)
+    user.add_property_changed_listener(CHANGED_LISTENER)
+    user.add_property_changing_listener(AGE_VALIDATOR, "age")
+    user.add_property_changing_listener(NAME_VALIDATOR, "name")
+    return user
+
+
+def assign_fields(user: Any, count: int) -> None:
+    for i in range(count):
+        user.name = "SCOTT" if i & 1 else "TRAVIS"
+        user.age = i
+
+
+def measure(factory: Any, count: int = 10_000, repeat: int = 5) -> float:
+    user = factory()
+    best = min(timeit.repeat(lambda: assign_fields(user, count), number=1, repeat=repeat))
+    return best / (count * 2) * 1e9
+
+
+def check_listener_leak(listener_count: int = 100) -> None:
+    user = User("TRAVIS", 34)
+    listeners = [PayloadListener() for _ in range(listener_count)]
+    payload_refs = [weakref.ref(listener) for listener in listeners]
+    for listener in listeners:
+        user.add_property_changed_listener(listener)
+
+    user.age = 35
+    del listener, listeners
+    gc.collect()
+
+    leaked = sum(ref() is not None for ref in payload_refs)
+    registered = sum(len(registry) for registry in user._changed_listeners.values())
+    assert leaked == 0, f"{leaked} listeners are still alive"
+    assert registered == 0, f"{registered} dead listeners are still registered"
+    user.age = 36
+    print(f"leak check: {listener_count} dropped listeners collected, registries empty")
+
+
+def measure_dispatch(
+    dispatcher: Optional[ListenerDispatcherProtocol],
+    listener_count: int = 10,
+    count: int = 5_000
+) -> Tuple[float, List[CountingListener]]:
+    user = User("TRAVIS", 0)
+    user.set_changed_dispatcher(dispatcher)
+    listeners = [CountingListener() for _ in range(listener_count)]
+    for listener in listeners:
+        user.add_property_changed_listener(listener, "age")
+
+    start = time.perf_counter()
+    for i in range(1, count + 1):
+        user.age = i
+    return time.perf_counter() - start, listeners
+
+
+def report_dispatch(label: str, setter_time: float, total_time: float, events: int) -> None:
+    print(f"{label:>9}: setter {events / setter_time:>12,.0f} events/s, "
+          f"delivered {events / total_time:>12,.0f} events/s")
+
+
+async def measure_loop_dispatch(listener_count: int, count: int) -> None:
+    loop = asyncio.get_running_loop()
+    setter_time, listeners = measure_dispatch(LoopDispatcher(loop), listener_count, count)
+    start = time.perf_counter() - setter_time
+    while sum(listener.count for listener in listeners) < listener_count * count:
+        await asyncio.sleep(0)
+    report_dispatch("asyncio", setter_time, time.perf_counter() - start, listener_count * count)
+
+
+def run_dispatch(listener_count: int = 10, count: int = 5_000) -> None:
+    events = listener_count * count
+    setter_time, _ = measure_dispatch(None, listener_count, count)
+    report_dispatch("sync", setter_time, setter_time, events)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        setter_time, _ = measure_dispatch(executor, listener_count, count)
+    report_dispatch("executor", setter_time, time.perf_counter() - start, events)
+
+    asyncio.run(measure_loop_dispatch(listener_count, count))
+
+
+def run() -> None:
+    hand_written = measure(make_hand_written_user)
+    observable = measure(make_observable_user)
+    print(f"hand-written User: {hand_written:8.1f} ns/assignment")
+    print(f"ObservableProperty: {observable:8.1f} ns/assignment")
+    print(f"ratio: {observable / hand_written:.2f}x")
+    check_listener_leak()
+    run_dispatch()
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,49 @@
+import os
+import tempfile
+import time
+
+from lab5 import DataRepository, ObservableUser, UnitOfWork, User
+
+
+def seed(filepath: str, factory: type, user_count: int) -> None:
+    repo = DataRepository(filepath)
+    repo.save_all([
+        factory(id=i, name=f"User{i}", login=f"user{i}", password="secret", email=f"user{i}@mail.com")
+        for i in range(user_count)
+    ])
+
+
+def measure_update_per_edit(filepath: str, user_count: int, edit_count: int) -> float:
+    seed(filepath, User, user_count)
+    repo = DataRepository[User](filepath)
+    start = time.perf_counter()
+    for i in range(edit_count):
+        user = repo.get_by_id(i % user_count)
+        user.name = f"User{i}"
+        repo.update(user)
+    return time.perf_counter() - start
+
+
+def measure_unit_of_work(filepath: str, user_count: int, edit_count: int) -> float:
+    seed(filepath, ObservableUser, user_count)
+    repo = DataRepository[ObservableUser](filepath)
+    start = time.perf_counter()
+    with UnitOfWork(repo) as uow:
+        for i in range(edit_count):
+            user = uow.get(i % user_count)
+            user.name = f"User{i}"
+    return time.perf_counter() - start
+
+
+def run(user_count: int = 1_000, edit_count: int = 2_000) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        before = measure_update_per_edit(os.path.join(tmp, "before.pkl"), user_count, edit_count)
+        after = measure_unit_of_work(os.path.join(tmp, "after.pkl"), user_count, edit_count)
+    print(f"{edit_count} edits over {user_count} users")
+    print(f"repo.update per edit: {before * 1e3:9.1f} ms")
+    print(f"UnitOfWork.commit:    {after * 1e3:9.1f} ms")
+    print(f"speedup: {before / after:.1f}x")
+
+
+if __name__ == "__main__":
+    run()
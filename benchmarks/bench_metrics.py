@@ -0,0 +1,58 @@
+import timeit
+from typing import Any, Callable
+
+from lab3 import Logger, SimpleLogFilter
+from metrics import MetricsRegistry, REGISTRY
+
+
+class NullHandler:
+    def handle(self, text: str) -> None:
+        pass
+
+
+def uninstrumented_log(logger: Logger, text: str) -> None:
+    for log_filter in logger.filters:
+        if not log_filter.match(text):
+            return
+
+    for handler in logger.handlers:
+        try:
+            handler.handle(text)
+        except Exception as e:
+            print(f"HANDLER ERROR: {handler.__class__.__name__} завершился с ошибкой: {e}")
+
+
+def measure(fn: Callable[[], Any], number: int = 100_000, repeat: int = 5) -> float:
+    return min(timeit.repeat(fn, number=number, repeat=repeat)) / number * 1e9
+
+
+def run() -> None:
+    logger = Logger(filters=[SimpleLogFilter("ERROR")], handlers=[NullHandler(), NullHandler()])
+    accepted = "ERROR: Database connection failed"
+    rejected = "INFO: Request served"
+
+    baseline = measure(lambda: (uninstrumented_log(logger, accepted), uninstrumented_log(logger, rejected)))
+    previous = REGISTRY.enabled
+    try:
+        REGISTRY.enabled = False
+        disabled = measure(lambda: (logger.log(accepted), logger.log(rejected)))
+        REGISTRY.enabled = True
+        enabled = measure(lambda: (logger.log(accepted), logger.log(rejected)))
+    finally:
+        REGISTRY.enabled = previous
+
+    print("Logger.log, one accepted and one rejected message")
+    print(f"uninstrumented:   {baseline:8.1f} ns")
+    print(f"metrics disabled: {disabled:8.1f} ns ({disabled / baseline - 1:+.1%})")
+    print(f"metrics enabled:  {enabled:8.1f} ns ({enabled / baseline - 1:+.1%})")
+
+    registry = MetricsRegistry(enabled=True)
+    counter = registry.counter("bench_total", "benchmark counter")
+    histogram = registry.histogram("bench_seconds", "benchmark histogram")
+    print(f"Counter.inc():               {measure(counter.inc):8.1f} ns")
+    print(f"Counter.inc(label=...):      {measure(lambda: counter.inc(handler='NullHandler')):8.1f} ns")
+    print(f"Histogram.observe(label=...): {measure(lambda: histogram.observe(0.001, handler='NullHandler')):8.1f} ns")
+
+
+if __name__ == "__main__":
+    run()
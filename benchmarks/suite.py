@@ -0,0 +1,285 @@
+import argparse
+import cProfile
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import timeit
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional
+
+from lab2.lab2 import Color, Font, Printer
+from lab3 import Logger, ReLogFilter, SimpleLogFilter
+from lab4 import User as ObservableDemoUser
+from lab5 import AuthService, DataRepository, User, UserRepository
+from main import Pointer2d, Vector2d
+from metrics import REGISTRY
+from benchmarks.bench_lab4 import CHANGED_LISTENER, make_observable_user
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FONT_FILE = os.path.join(ROOT, "lab2", "letters.txt")
+SEED = 42
+
+BenchmarkSetup = Callable[[str], Callable[[], Any]]
+BENCHMARKS: Dict[str, BenchmarkSetup] = {}
+
+
+def benchmark(name: str) -> Callable[[BenchmarkSetup], BenchmarkSetup]:
+    def register(setup: BenchmarkSetup) -> BenchmarkSetup:
+        BENCHMARKS[name] = setup
+        return setup
+    return register
+
+
+class CollectingHandler:
+    def __init__(self) -> None:
+        self.records: List[str] = []
+
+    def handle(self, text: str) -> None:
+        self.records.append(text)
+
+
+def make_users(count: int) -> List[User]:
+    return [
+        User(id=i, name=f"User{i}", login=f"user{i}", password="secret", email=f"user{i}@mail.com")
+        for i in range(count)
+    ]
+
+
+@benchmark("lab1.vector_arithmetic")
+def setup_vector_arithmetic(workdir: str) -> Callable[[], Any]:
+    rng = random.Random(SEED)
+    vectors = [
+        Vector2d(start=Pointer2d(rng.randint(0, 1920), rng.randint(0, 1080)),
+                 end=Pointer2d(rng.randint(0, 1920), rng.randint(0, 1080)))
+        for _ in range(1_000)
+    ]
+
+    def run() -> int:
+        total = 0
+        for v1, v2 in zip(vectors, vectors[1:]):
+            v = (v1 + v2 - v1) * 3
+            total += v.dot(v2) + v.cross(v1) + abs(v) + Vector2d.mixed_product(v1, v2, v)
+        return total
+    return run
+
+
+@benchmark("lab2.printer_print")
+def setup_printer_print(workdir: str) -> Callable[[], Any]:
+    font = Font(FONT_FILE)
+    rng = random.Random(SEED)
+    letters = [letter for letter in font.font_map if len(letter) == 1]
+    texts = ["".join(rng.choice(letters) for _ in range(12)) for _ in range(20)]
+    with contextlib.redirect_stdout(io.StringIO()):
+        printer = Printer(Color.GREEN, (1, 1), "#", font, scale=2)
+
+    def run() -> int:
+        sink = io.StringIO()
+        with contextlib.redirect_stdout(sink):
+            for text in texts:
+                printer.print(text)
+        return sink.tell()
+    return run
+
+
+@benchmark("lab3.logger_log")
+def setup_logger_log(workdir: str) -> Callable[[], Any]:
+    rng = random.Random(SEED)
+    levels = ["ERROR", "WARN", "INFO", "DEBUG"]
+    lines = [
+        f"{rng.choice(levels)}: HTTP/1.{rng.randint(0, 1)} GET /item/{rng.randint(0, 9999)} {rng.randint(200, 504)}"
+        for _ in range(2_000)
+    ]
+    handler = CollectingHandler()
+    loggers = [
+        Logger(filters=[SimpleLogFilter("ERROR")], handlers=[handler]),
+        Logger(filters=[ReLogFilter(r"HTTP/\d\.\d"), SimpleLogFilter("WARN")], handlers=[handler, handler]),
+    ]
+
+    def run() -> int:
+        handler.records.clear()
+        for line in lines:
+            for logger in loggers:
+                logger.log(line)
+        return len(handler.records)
+    return run
+
+
+@benchmark("metrics.logger_log_enabled")
+def setup_logger_log_with_metrics(workdir: str) -> Callable[[], Any]:
+    log_lines = setup_logger_log(workdir)
+
+    def run() -> int:
+        previous = REGISTRY.enabled
+        REGISTRY.enabled = True
+        try:
+            return log_lines()
+        finally:
+            REGISTRY.enabled = previous
+    return run
+
+
+@benchmark("lab4.property_dispatch")
+def setup_property_dispatch(workdir: str) -> Callable[[], Any]:
+    users = [make_observable_user() for _ in range(10)]
+    plain: List[ObservableDemoUser] = [ObservableDemoUser("TRAVIS", 34) for _ in range(10)]
+    for user in plain:
+        user.add_property_changed_listener(CHANGED_LISTENER, "age")
+
+    def run() -> None:
+        for i in range(1_000):
+            for user in users:
+                user.name = "SCOTT" if i & 1 else "TRAVIS"
+                user.age = i
+            for user in plain:
+                user.age = i
+    return run
+
+
+@benchmark("lab5.repository_crud")
+def setup_repository_crud(workdir: str) -> Callable[[], Any]:
+    filepath = os.path.join(workdir, "crud.pkl")
+    users = make_users(200)
+
+    def run() -> None:
+        if os.path.exists(filepath):
+            os.remove(filepath)
+        repo = DataRepository[User](filepath)
+        repo.save_all(users)
+        for user in users[:50]:
+            repo.update(repo.get_by_id(user.id))
+        for user in users[-50:]:
+            repo.delete(user)
+        for user in users[-50:]:
+            repo.add(user)
+    return run
+
+
+@benchmark("lab5.auth_service")
+def setup_auth_service(workdir: str) -> Callable[[], Any]:
+    users_file = os.path.join(workdir, "auth_users.pkl")
+    session_file = os.path.join(workdir, "auth_session.pkl")
+    if os.path.exists(users_file):
+        os.remove(users_file)
+    repo = UserRepository(users_file)
+    repo.save_all(make_users(500))
+    rng = random.Random(SEED)
+    logins = [f"user{rng.randrange(500)}" for _ in range(100)]
+
+    def run() -> None:
+        for login in logins:
+            auth = AuthService(session_file, repo)
+            auth.sign_in(repo.get_by_login(login))
+            AuthService(session_file, repo).sign_out()
+    return run
+
+
+def profile_benchmark(name: str, fn: Callable[[], Any], profile_dir: str) -> str:
+    os.makedirs(profile_dir, exist_ok=True)
+    path = os.path.join(profile_dir, f"{name}.prof")
+    profiler = cProfile.Profile()
+    profiler.runcall(fn)
+    profiler.dump_stats(path)
+    return path
+
+
+def trace_memory(fn: Callable[[], Any]) -> Dict[str, int]:
+    tracemalloc.start()
+    try:
+        fn()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"current_bytes": current, "peak_bytes": peak}
+
+
+def run_benchmarks(
+    names: List[str],
+    repeat: int,
+    number: int,
+    profile_dir: Optional[str] = None,
+    track_memory: bool = False
+) -> Dict[str, Any]:
+    results: Dict[str, Any] = {}
+    metrics_enabled = REGISTRY.enabled
+    REGISTRY.enabled = False
+    try:
+        with tempfile.TemporaryDirectory() as workdir:
+            for name in names:
+                fn = BENCHMARKS[name](workdir)
+                timings = [t / number for t in timeit.repeat(fn, number=number, repeat=repeat)]
+                result: Dict[str, Any] = {
+                    "min": min(timings),
+                    "mean": statistics.fmean(timings),
+                    "stdev": statistics.stdev(timings) if len(timings) > 1 else 0.0,
+                    "repeat": repeat,
+                    "number": number,
+                }
+                if profile_dir is not None:
+                    result["profile"] = profile_benchmark(name, fn, profile_dir)
+                if track_memory:
+                    result["memory"] = trace_memory(fn)
+                results[name] = result
+                print(f"{name:<28} min {result['min'] * 1e3:10.3f} ms   mean {result['mean'] * 1e3:10.3f} ms",
+                      file=sys.stderr)
+    finally:
+        REGISTRY.enabled = metrics_enabled
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "benchmarks": results,
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    regressions = []
+    for name, result in current["benchmarks"].items():
+        previous = baseline.get("benchmarks", {}).get(name)
+        if previous is None:
+            print(f"{name:<28} (no baseline)", file=sys.stderr)
+            continue
+        ratio = result["min"] / previous["min"]
+        status = "REGRESSION" if ratio > 1 + threshold else "ok"
+        print(f"{name:<28} {ratio:6.2f}x baseline  {status}", file=sys.stderr)
+        if status != "ok":
+            regressions.append(name)
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Run the lab benchmark suite.")
+    parser.add_argument("-k", "--filter", default="", help="run only benchmarks whose name contains this text")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--number", type=int, default=3)
+    parser.add_argument("-o", "--output", help="write JSON results to this file instead of stdout")
+    parser.add_argument("--baseline", help="JSON results to compare against")
+    parser.add_argument("--threshold", type=float, default=0.1, help="allowed slowdown before a regression")
+    parser.add_argument("--profile", metavar="DIR", help="dump a cProfile .prof file per benchmark into DIR")
+    parser.add_argument("--tracemalloc", action="store_true", help="record peak memory per benchmark")
+    parser.add_argument("--list", action="store_true", help="list benchmark names and exit")
+    args = parser.parse_args(argv)
+
+    names = [name for name in BENCHMARKS if args.filter in name]
+    if args.list:
+        print("\n".join(names))
+        return 0
+
+    results = run_benchmarks(names, args.repeat, args.number, args.profile, args.tracemalloc)
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        if compare(results, baseline, args.threshold):
+            return 1
+    return 0
@@ -1,6 +1,18 @@
+import os
+import time
 from enum import Enum
 from typing import Tuple, Optional
 
+try:
+    from metrics import REGISTRY
+except ImportError:
+    REGISTRY = None
+
+if REGISTRY is not None:
+    PRINTER_CALLS = REGISTRY.counter("printer_print_total", "Calls to Printer.print")
+    PRINTER_BYTES = REGISTRY.counter("printer_bytes_emitted_total", "Bytes written to the console by Printer.print")
+    PRINTER_LATENCY = REGISTRY.histogram("printer_print_seconds", "Time spent rendering and printing text")
+
 
 class Color(Enum):
     RED = 31
@@ -65,6 +77,8 @@ class Printer:
         return scaled
 
     def print(self, text: str) -> None:
+        enabled = REGISTRY is not None and REGISTRY.enabled
+        start = time.perf_counter() if enabled else 0.0
         y, x = self.position
         output_lines = []
         for line_idx in range(5):
@@ -79,8 +93,17 @@ class Printer:
                     combined = "  ".join(part[row_offset] for part in line_parts)
                     output_lines.append(combined)
 
+        emitted = 0
         for i, line in enumerate(output_lines):
-            print(f"\033[{y + i};{x}H\033[{self.color.value}m{line}\033[0m")
+            rendered = f"\033[{y + i};{x}H\033[{self.color.value}m{line}\033[0m"
+            print(rendered)
+            if enabled:
+                emitted += len(rendered.encode()) + 1
+
+        if enabled:
+            PRINTER_CALLS.inc()
+            PRINTER_BYTES.inc(emitted)
+            PRINTER_LATENCY.observe(time.perf_counter() - start)
 
     def __enter__(self) -> 'Printer':
         return self
@@ -103,7 +126,7 @@ class Printer:
 
 
 if __name__ == "__main__":
-    loaded_font = Font("letters.txt")
+    loaded_font = Font(os.path.join(os.path.dirname(os.path.abspath(__file__)), "letters.txt"))
 
     Printer.print_static("AB", Color.RED, (10, 10), "*", loaded_font, scale=2)
 
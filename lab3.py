@@ -1,6 +1,14 @@
 import re
+import time
 from typing import List, Protocol
 
+from metrics import REGISTRY
+
+LOG_MESSAGES = REGISTRY.counter("logger_messages_total", "Messages passed to Logger.log")
+LOG_FILTER_REJECTIONS = REGISTRY.counter("logger_filter_rejections_total", "Messages rejected per filter")
+LOG_HANDLER_LATENCY = REGISTRY.histogram("logger_handler_seconds", "Time spent in each log handler")
+LOG_HANDLER_ERRORS = REGISTRY.counter("logger_handler_errors_total", "Exceptions raised by log handlers")
+
 
 class LogFilterProtocol(Protocol):
     def match(self, text: str) -> bool:
@@ -12,6 +20,19 @@ class LogHandlerProtocol(Protocol):
         pass
 
 
+def _filter_pattern(log_filter: LogFilterProtocol) -> str:
+    pattern = getattr(log_filter, "pattern", "")
+    return pattern.pattern if isinstance(pattern, re.Pattern) else str(pattern)
+
+
+def _handler_target(handler: LogHandlerProtocol) -> str:
+    if hasattr(handler, "filename"):
+        return str(handler.filename)
+    if hasattr(handler, "host") and hasattr(handler, "port"):
+        return f"{handler.host}:{handler.port}"
+    return str(getattr(handler, "facility", ""))
+
+
 class SimpleLogFilter:
     def __init__(self, pattern: str):
         self.pattern = pattern
@@ -80,15 +101,32 @@ class Logger:
         self.handlers = handlers
 
     def log(self, text: str) -> None:
+        enabled = REGISTRY.enabled
+        if enabled:
+            LOG_MESSAGES.inc()
+
         for log_filter in self.filters:
             if not log_filter.match(text):
+                if enabled:
+                    LOG_FILTER_REJECTIONS.inc(
+                        filter=log_filter.__class__.__name__, pattern=_filter_pattern(log_filter)
+                    )
                 return
 
         for handler in self.handlers:
+            start = time.perf_counter() if enabled else 0.0
             try:
                 handler.handle(text)
             except Exception as e:
+                if enabled:
+                    LOG_HANDLER_ERRORS.inc(handler=handler.__class__.__name__, target=_handler_target(handler))
                 print(f"HANDLER ERROR: {handler.__class__.__name__} завершился с ошибкой: {e}")
+            if enabled:
+                LOG_HANDLER_LATENCY.observe(
+                    time.perf_counter() - start,
+                    handler=handler.__class__.__name__,
+                    target=_handler_target(handler)
+                )
 
 
 if __name__ == "__main__":
@@ -1,6 +1,11 @@
-from abc import ABC, abstractmethod
-from typing import List, TypeVar, Any
+import asyncio
+import inspect
+import weakref
+from concurrent.futures import Future
+from abc import ABC, ABCMeta, abstractmethod
+from typing import Any, Callable, Dict, Generic, Iterator, List, Optional, Protocol, Set, Tuple, TypeVar
 T = TypeVar('T')
+L = TypeVar('L')
 
 
 class PropertyChangedListenerProtocol(ABC):
@@ -16,90 +21,305 @@ class PropertyChangingListenerProtocol(ABC):
 
 
 class DataChangedProtocol(ABC):
+    __slots__ = ()
+
     @abstractmethod
-    def add_property_changed_listener(self, listener: PropertyChangedListenerProtocol) -> None:
+    def add_property_changed_listener(
+        self,
+        listener: PropertyChangedListenerProtocol,
+        property_name: Optional[str] = None
+    ) -> None:
         pass
 
     @abstractmethod
-    def remove_property_changed_listener(self, listener: PropertyChangedListenerProtocol) -> None:
+    def remove_property_changed_listener(
+        self,
+        listener: PropertyChangedListenerProtocol,
+        property_name: Optional[str] = None
+    ) -> None:
         pass
 
 
 class DataChangingProtocol(ABC):
+    __slots__ = ()
+
     @abstractmethod
-    def add_property_changing_listener(self, listener: PropertyChangingListenerProtocol) -> None:
+    def add_property_changing_listener(
+        self,
+        listener: PropertyChangingListenerProtocol,
+        property_name: Optional[str] = None
+    ) -> None:
         pass
 
     @abstractmethod
-    def remove_property_changing_listener(self, listener: PropertyChangingListenerProtocol) -> None:
+    def remove_property_changing_listener(
+        self,
+        listener: PropertyChangingListenerProtocol,
+        property_name: Optional[str] = None
+    ) -> None:
         pass
 
 
-class User(DataChangedProtocol, DataChangingProtocol):
-    def __init__(self, name: str, age: int) -> None:
-        self._name = name
-        self._age = age
-        self._changed_listeners: List[PropertyChangedListenerProtocol] = []
-        self._changing_listeners: List[PropertyChangingListenerProtocol] = []
+class ListenerRegistry(Generic[L]):
+    __slots__ = ("_refs", "_snapshot", "_self_ref", "__weakref__")
 
-    def add_property_changed_listener(self, listener: PropertyChangedListenerProtocol) -> None:
-        self._changed_listeners.append(listener)
+    def __init__(self) -> None:
+        self._refs: Dict[int, weakref.ref] = {}
+        self._snapshot: Optional[Tuple[weakref.ref, ...]] = ()
+        self._self_ref = weakref.ref(self)
 
-    def remove_property_changed_listener(self, listener: PropertyChangedListenerProtocol) -> None:
-        self._changed_listeners.remove(listener)
+    def _discard(self, key: int, ref: weakref.ref) -> None:
+        if self._refs.get(key) is ref:
+            del self._refs[key]
+            self._snapshot = None
 
-    def add_property_changing_listener(self, listener: PropertyChangingListenerProtocol) -> None:
-        self._changing_listeners.append(listener)
+    def _lookup(self, listener: L) -> Optional[weakref.ref]:
+        ref = self._refs.get(id(listener))
+        if ref is not None and ref() is listener:
+            return ref
+        return None
 
-    def remove_property_changing_listener(self, listener: PropertyChangingListenerProtocol) -> None:
-        self._changing_listeners.remove(listener)
+    def add(self, listener: L) -> None:
+        if self._lookup(listener) is not None:
+            return
+        key = id(listener)
+        registry_ref = self._self_ref
 
-    @property
-    def name(self) -> str:
-        return self._name
+        def on_collected(ref: weakref.ref) -> None:
+            registry = registry_ref()
+            if registry is not None:
+                registry._discard(key, ref)
 
-    @name.setter
-    def name(self, value: Any) -> None:
-        if self._changing_listeners:
-            allowed = all(
-                listener.on_property_changing(self, "name", self._name, value)
-                for listener in self._changing_listeners
-            )
-            if not allowed:
-                return
+        self._refs[key] = weakref.ref(listener, on_collected)
+        self._snapshot = None
 
-        self._name = value
+    def remove(self, listener: L) -> None:
+        ref = self._lookup(listener)
+        if ref is None:
+            raise ValueError(f"{listener!r} is not registered")
+        self._discard(id(listener), ref)
 
-        for listener in self._changed_listeners:
-            listener.on_property_changed(self, "name")
+    def __contains__(self, listener: L) -> bool:
+        return self._lookup(listener) is not None
 
-    @property
-    def age(self) -> int:
-        return self._age
+    def __len__(self) -> int:
+        return len(self._refs)
+
+    def __bool__(self) -> bool:
+        return bool(self._refs)
+
+    def __iter__(self) -> Iterator[L]:
+        snapshot = self._snapshot
+        if snapshot is None:
+            snapshot = self._snapshot = tuple(self._refs.values())
+        for ref in snapshot:
+            listener = ref()
+            if listener is not None:
+                yield listener
 
-    @age.setter
-    def age(self, value: Any) -> None:
-        try:
-            value = int(value)
-        except (ValueError, TypeError):
-            print("Validation failed: Age must be a number")
-            return
 
-        if self._age == value:
+class ListenerDispatcherProtocol(Protocol):
+    def submit(self, fn: Callable[..., Any], *args: Any) -> Any:
+        pass
+
+
+def _notify_changed(
+    listeners: Tuple[PropertyChangedListenerProtocol, ...],
+    obj: Any,
+    property_name: str
+) -> List[Any]:
+    results = [listener.on_property_changed(obj, property_name) for listener in listeners]
+    return [result for result in results if inspect.isawaitable(result)]
+
+
+def _report_listener_error(future: Future) -> None:
+    if future.cancelled():
+        return
+    error = future.exception()
+    if error is not None:
+        print(f"Listener error: on_property_changed failed with {error!r}")
+
+
+class LoopDispatcher:
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self.loop = loop
+        self._tasks: Set[asyncio.Future] = set()
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> None:
+        self.loop.call_soon_threadsafe(self._run, fn, args)
+
+    def _run(self, fn: Callable[..., Any], args: Tuple[Any, ...]) -> None:
+        result = fn(*args)
+        for awaitable in result if isinstance(result, list) else [result]:
+            if inspect.isawaitable(awaitable):
+                task = asyncio.ensure_future(awaitable, loop=self.loop)
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+
+
+class ObservableProperty(Generic[T]):
+    def __init__(
+        self,
+        coerce: Optional[Callable[[Any], T]] = None,
+        error_message: str = "",
+        skip_unchanged: bool = False
+    ) -> None:
+        self.coerce = coerce
+        self.error_message = error_message
+        self.skip_unchanged = skip_unchanged
+        self.name = ""
+        self.storage_name = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+        self.storage_name = f"_{name}"
+
+    def __get__(self, obj: Any, objtype: Optional[type] = None) -> Any:
+        if obj is None:
+            return self
+        return getattr(obj, self.storage_name)
+
+    def __set__(self, obj: Any, value: Any) -> None:
+        if self.coerce is not None:
+            try:
+                value = self.coerce(value)
+            except (ValueError, TypeError):
+                print(f"Validation failed: {self.error_message}")
+                return
+
+        old_value = getattr(obj, self.storage_name)
+        if self.skip_unchanged and old_value == value:
             return
 
-        if self._changing_listeners:
-            allowed: bool = all(
-                listener.on_property_changing(self, "age", self._age, value)
-                for listener in self._changing_listeners
-            )
-            if not allowed:
+        for listener in obj._changing_listeners[self.name]:
+            if not listener.on_property_changing(obj, self.name, old_value, value):
                 return
 
-        self._age = value
+        setattr(obj, self.storage_name, value)
+
+        dispatcher = obj._changed_dispatcher
+        if dispatcher is None:
+            for listener in obj._changed_listeners[self.name]:
+                listener.on_property_changed(obj, self.name)
+        else:
+            listeners = tuple(obj._changed_listeners[self.name])
+            if listeners:
+                result = dispatcher.submit(_notify_changed, listeners, obj, self.name)
+                if isinstance(result, Future):
+                    result.add_done_callback(_report_listener_error)
+
+
+class ObservableMeta(ABCMeta):
+    def __new__(mcs, name: str, bases: Tuple[type, ...], namespace: Dict[str, Any], **kwargs: Any) -> type:
+        own_properties = [
+            attr_name for attr_name, value in namespace.items()
+            if isinstance(value, ObservableProperty)
+        ]
+        if own_properties or "__slots__" in namespace:
+            declared = namespace.get("__slots__", ())
+            if isinstance(declared, str):
+                declared = (declared,)
+            declared = tuple(declared)
+            namespace["__slots__"] = declared + tuple(
+                f"_{attr_name}" for attr_name in own_properties if f"_{attr_name}" not in declared
+            )
+
+        cls = super().__new__(mcs, name, bases, namespace, **kwargs)
+
+        inherited = [
+            attr_name for base in reversed(cls.__mro__[1:])
+            for attr_name in getattr(base, "_observable_properties", ())
+        ]
+        cls._observable_properties = tuple(dict.fromkeys(inherited + own_properties))
+        return cls
+
+
+class ObservableObject(DataChangedProtocol, DataChangingProtocol, metaclass=ObservableMeta):
+    __slots__ = ("_changed_listeners", "_changing_listeners", "_changed_dispatcher")
+    _observable_properties: Tuple[str, ...] = ()
+
+    def __init__(self) -> None:
+        self._changed_listeners: Dict[str, ListenerRegistry[PropertyChangedListenerProtocol]] = {
+            name: ListenerRegistry() for name in self._observable_properties
+        }
+        self._changing_listeners: Dict[str, ListenerRegistry[PropertyChangingListenerProtocol]] = {
+            name: ListenerRegistry() for name in self._observable_properties
+        }
+        self._changed_dispatcher: Optional[ListenerDispatcherProtocol] = None
+
+    def _registries(
+        self,
+        registries: Dict[str, ListenerRegistry[Any]],
+        property_name: Optional[str]
+    ) -> List[ListenerRegistry[Any]]:
+        if property_name is None:
+            return list(registries.values())
+        if property_name not in registries:
+            raise AttributeError(f"{self.__class__.__name__} has no observable property '{property_name}'")
+        return [registries[property_name]]
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {name: getattr(self, f"_{name}") for name in self._observable_properties}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        ObservableObject.__init__(self)
+        for name, value in state.items():
+            setattr(self, f"_{name}", value)
+
+    def _remove_listener(
+        self,
+        registries: Dict[str, ListenerRegistry[Any]],
+        listener: Any,
+        property_name: Optional[str]
+    ) -> None:
+        found = [registry for registry in self._registries(registries, property_name) if listener in registry]
+        if not found:
+            raise ValueError(f"{listener!r} is not registered")
+        for registry in found:
+            registry.remove(listener)
+
+    def set_changed_dispatcher(self, dispatcher: Optional[ListenerDispatcherProtocol]) -> None:
+        self._changed_dispatcher = dispatcher
+
+    def add_property_changed_listener(
+        self,
+        listener: PropertyChangedListenerProtocol,
+        property_name: Optional[str] = None
+    ) -> None:
+        for registry in self._registries(self._changed_listeners, property_name):
+            registry.add(listener)
+
+    def remove_property_changed_listener(
+        self,
+        listener: PropertyChangedListenerProtocol,
+        property_name: Optional[str] = None
+    ) -> None:
+        self._remove_listener(self._changed_listeners, listener, property_name)
+
+    def add_property_changing_listener(
+        self,
+        listener: PropertyChangingListenerProtocol,
+        property_name: Optional[str] = None
+    ) -> None:
+        for registry in self._registries(self._changing_listeners, property_name):
+            registry.add(listener)
+
+    def remove_property_changing_listener(
+        self,
+        listener: PropertyChangingListenerProtocol,
+        property_name: Optional[str] = None
+    ) -> None:
+        self._remove_listener(self._changing_listeners, listener, property_name)
+
+
+class User(ObservableObject):
+    name = ObservableProperty[str]()
+    age = ObservableProperty[int](int, "Age must be a number", skip_unchanged=True)
 
-        for listener in self._changed_listeners:
-            listener.on_property_changed(self, "age")
+    def __init__(self, name: str, age: int) -> None:
+        super().__init__()
+        self._name = name
+        self._age = age
 
 
 class LoggerListener(PropertyChangedListenerProtocol):
@@ -134,8 +354,8 @@ if __name__ == "__main__":
 
     age_validator = AgeValidator()
     name_validator = NameValidator()
-    user.add_property_changing_listener(age_validator)
-    user.add_property_changing_listener(name_validator)
+    user.add_property_changing_listener(age_validator, "age")
+    user.add_property_changing_listener(name_validator, "name")
 
     print("Valid changes:")
     user.name = "SCOTT"
@@ -1,8 +1,30 @@
+import atexit
+import copy
 import pickle
 import os
 import json
+import threading
+import time
+import weakref
 from dataclasses import dataclass, field, asdict
-from typing import Optional, Protocol, TypeVar, Sequence, Generic, runtime_checkable
+from typing import Any, Callable, Optional, Protocol, TypeVar, Sequence, Generic, runtime_checkable
+
+from lab4 import DataChangedProtocol, ObservableObject, ObservableProperty, PropertyChangedListenerProtocol
+from metrics import REGISTRY
+
+REPOSITORY_LOAD_LATENCY = REGISTRY.histogram("repository_load_seconds", "Time spent loading a repository file")
+REPOSITORY_SAVE_LATENCY = REGISTRY.histogram("repository_save_seconds", "Time spent saving a repository file")
+REPOSITORY_BYTES_WRITTEN = REGISTRY.counter("repository_bytes_written_total", "Bytes written to repository files")
+REPOSITORY_RECORDS = REGISTRY.gauge("repository_records", "Records held by a repository")
+REPOSITORY_LOOKUPS = REGISTRY.counter("repository_lookups_total", "Linear lookups performed by repositories")
+REPOSITORY_LOOKUP_SCANNED = REGISTRY.counter(
+    "repository_lookup_scanned_total", "Records compared during repository lookups"
+)
+AUTH_SIGN_INS = REGISTRY.counter("auth_sign_ins_total", "Calls to AuthService.sign_in")
+AUTH_SIGN_OUTS = REGISTRY.counter("auth_sign_outs_total", "Calls to AuthService.sign_out")
+AUTH_SESSION_RESTORES = REGISTRY.counter("auth_session_restores_total", "Saved sessions loaded by AuthService")
+AUTH_SESSION_ERRORS = REGISTRY.counter("auth_session_errors_total", "Failed session loads and saves")
+AUTH_AUTHORIZED = REGISTRY.gauge("auth_authorized", "1 while an AuthService has a signed-in user")
 
 
 @dataclass(order=True)
@@ -24,6 +46,55 @@ class User:
         return data
 
 
+class ObservableUser(ObservableObject):
+    __slots__ = ("_id",)
+
+    name = ObservableProperty[str]()
+    login = ObservableProperty[str]()
+    password = ObservableProperty[str]()
+    email = ObservableProperty[Optional[str]]()
+    address = ObservableProperty[Optional[str]]()
+
+    def __init__(
+        self,
+        id: int,
+        name: str,
+        login: str,
+        password: str,
+        email: Optional[str] = None,
+        address: Optional[str] = None
+    ) -> None:
+        super().__init__()
+        self._id = id
+        self._name = name
+        self._login = login
+        self._password = password
+        self._email = email
+        self._address = address
+
+    @property
+    def id(self) -> int:  # noqa: A003
+        return self._id
+
+    def __getstate__(self) -> dict:
+        return {"id": self._id, **super().__getstate__()}
+
+    def __setstate__(self, state: dict) -> None:
+        state = dict(state)
+        identifier = state.pop("id")
+        super().__setstate__(state)
+        self._id = identifier
+
+    def __repr__(self) -> str:
+        return (f"ObservableUser(id={self.id!r}, name={self.name!r}, login={self.login!r}, "
+                f"email={self.email!r}, address={self.address!r})")
+
+    def to_dict(self) -> dict:
+        data = self.__getstate__()
+        data.pop("password", None)
+        return data
+
+
 T = TypeVar('T')
 
 
@@ -50,47 +121,228 @@ class IUserRepository(IDataRepository[User], Protocol):
         pass
 
 
+def _scan(items: Sequence[T], predicate: Callable[[T], bool], lookup: str) -> Optional[T]:
+    scanned = 0
+    found = None
+    for item in items:
+        scanned += 1
+        if predicate(item):
+            found = item
+            break
+    REPOSITORY_LOOKUPS.inc(lookup=lookup)
+    REPOSITORY_LOOKUP_SCANNED.inc(scanned, lookup=lookup)
+    return found
+
+
 class DataRepository(Generic[T], IDataRepository[T]):
     def __init__(self, filepath: str):
         self.filepath = filepath
+        self._lock = threading.RLock()
         self._data: list[T] = self._load()
 
     def _load(self) -> list[T]:
+        enabled = REGISTRY.enabled
+        start = time.perf_counter() if enabled else 0.0
+        data: list[T] = []
         if os.path.exists(self.filepath):
             try:
                 with open(self.filepath, 'rb') as f:
-                    return pickle.load(f)
+                    data = pickle.load(f)
             except (OSError, pickle.PickleError) as e:
                 print(f"Ошибка при загрузке данных из {self.filepath}: {e}")
-        return []
+        if enabled:
+            repository = os.path.basename(self.filepath)
+            REPOSITORY_LOAD_LATENCY.observe(time.perf_counter() - start, repository=repository)
+            REPOSITORY_RECORDS.set(len(data), repository=repository)
+        return data
+
+    def _write(self, data: list[T]) -> None:
+        enabled = REGISTRY.enabled
+        start = time.perf_counter() if enabled else 0.0
+        tmp_path = f"{self.filepath}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(data, f)
+                written = f.tell()
+            os.replace(tmp_path, self.filepath)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        if enabled:
+            repository = os.path.basename(self.filepath)
+            REPOSITORY_SAVE_LATENCY.observe(time.perf_counter() - start, repository=repository)
+            REPOSITORY_BYTES_WRITTEN.inc(written, repository=repository)
+            REPOSITORY_RECORDS.set(len(data), repository=repository)
 
     def _save(self) -> None:
         try:
-            with open(self.filepath, 'wb') as f:
-                pickle.dump(self._data, f)
+            self._write(self._data)
         except (OSError, pickle.PickleError) as e:
             print(f"Ошибка при сохранении данных в {self.filepath}: {e}")
 
     def get_all(self) -> Sequence[T]:
-        return list(self._data)
+        with self._lock:
+            return list(self._data)
 
     def get_by_id(self, id: int) -> Optional[T]:
-        return next((item for item in self._data if getattr(item, 'id', None) == id), None)
+        with self._lock:
+            if REGISTRY.enabled:
+                return _scan(self._data, lambda item: getattr(item, 'id', None) == id, "id")
+            return next((item for item in self._data if getattr(item, 'id', None) == id), None)
 
     def add(self, item: T) -> None:
-        self._data.append(item)
-        self._save()
+        with self._lock:
+            self._data.append(item)
+            self._save()
 
     def update(self, item: T) -> None:
-        for i, existing in enumerate(self._data):
-            if getattr(existing, 'id', None) == getattr(item, 'id', None):
-                self._data[i] = item
-                self._save()
-                return
+        with self._lock:
+            for i, existing in enumerate(self._data):
+                if getattr(existing, 'id', None) == getattr(item, 'id', None):
+                    self._data[i] = item
+                    self._save()
+                    return
 
     def delete(self, item: T) -> None:
-        self._data = [x for x in self._data if getattr(x, 'id', None) != getattr(item, 'id', None)]
-        self._save()
+        with self._lock:
+            self._data = [x for x in self._data if getattr(x, 'id', None) != getattr(item, 'id', None)]
+            self._save()
+
+    def save_all(self, items: Sequence[T]) -> None:
+        if not items:
+            return
+        with self._lock:
+            data = list(self._data)
+            positions = {getattr(existing, 'id', None): i for i, existing in enumerate(data)}
+            for item in items:
+                position = positions.get(getattr(item, 'id', None))
+                if position is None:
+                    positions[getattr(item, 'id', None)] = len(data)
+                    data.append(item)
+                else:
+                    data[position] = item
+            self._write(data)
+            self._data = data
+
+
+class UnitOfWork(PropertyChangedListenerProtocol, Generic[T]):
+    def __init__(self, repo: DataRepository[T], flush_interval: Optional[float] = None) -> None:
+        self.repo = repo
+        self.flush_interval = flush_interval
+        self._identity_map: dict[Any, T] = {}
+        self._dirty: dict[Any, T] = {}
+        self._lock = threading.RLock()
+        self._timer: Optional[threading.Timer] = None
+        self._exit_hook: Optional[Callable[[], None]] = None
+        if flush_interval is not None:
+            uow_ref = weakref.ref(self)
+
+            def flush_at_exit() -> None:
+                uow = uow_ref()
+                if uow is not None and uow.has_changes:
+                    uow._flush_at_exit()
+
+            self._exit_hook = flush_at_exit
+            atexit.register(flush_at_exit)
+
+    def _track(self, item: T) -> None:
+        self._identity_map[getattr(item, 'id', None)] = item
+        if isinstance(item, DataChangedProtocol):
+            item.add_property_changed_listener(self)
+
+    def _untrack(self, key: Any) -> None:
+        item = self._identity_map.pop(key, None)
+        if isinstance(item, DataChangedProtocol):
+            item.remove_property_changed_listener(self)
+
+    def _schedule_flush(self) -> None:
+        if self.flush_interval is not None and self._timer is None:
+            self._timer = threading.Timer(self.flush_interval, self._flush_on_timer)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _flush_on_timer(self) -> None:
+        with self._lock:
+            if self._timer is not threading.current_thread():
+                return
+            self._timer = None
+            try:
+                self.commit()
+            except Exception as e:
+                print(f"Ошибка отложенной записи в {self.repo.filepath}: {e}")
+                self._schedule_flush()
+
+    def _flush_at_exit(self) -> None:
+        with self._lock:
+            try:
+                self.commit()
+            except Exception as e:
+                print(f"Ошибка записи при завершении программы в {self.repo.filepath}: {e}")
+
+    def get(self, id: int) -> Optional[T]:
+        with self._lock:
+            if id in self._identity_map:
+                return self._identity_map[id]
+            stored = self.repo.get_by_id(id)
+            if stored is None:
+                return None
+            item = copy.deepcopy(stored)
+            self._track(item)
+            return item
+
+    def add(self, item: T) -> None:
+        with self._lock:
+            self._track(item)
+            self.mark_dirty(item)
+
+    def mark_dirty(self, item: T) -> None:
+        with self._lock:
+            self._dirty[getattr(item, 'id', None)] = item
+            self._schedule_flush()
+
+    def on_property_changed(self, obj: Any, property_name: str) -> None:
+        self.mark_dirty(obj)
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self._dirty)
+
+    def _cancel_flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def commit(self) -> None:
+        with self._lock:
+            self._cancel_flush()
+            dirty = list(self._dirty.values())
+            self.repo.save_all([copy.deepcopy(item) for item in dirty])
+            self._dirty.clear()
+
+    def discard(self) -> None:
+        with self._lock:
+            self._cancel_flush()
+            for key in self._dirty:
+                self._untrack(key)
+            self._dirty.clear()
+
+    def close(self) -> None:
+        with self._lock:
+            self.commit()
+            for key in list(self._identity_map):
+                self._untrack(key)
+            if self._exit_hook is not None:
+                atexit.unregister(self._exit_hook)
+                self._exit_hook = None
+
+    def __enter__(self) -> 'UnitOfWork[T]':
+        return self
+
+    def __exit__(self, exc_type: Optional[type], exc_val: Optional[BaseException], exc_tb: Optional[object]) -> None:
+        if exc_type is not None:
+            self.discard()
+        self.close()
 
 
 class UserRepository(IUserRepository):
@@ -112,7 +364,12 @@ class UserRepository(IUserRepository):
     def delete(self, item: User) -> None:
         self.repo.delete(item)
 
+    def save_all(self, items: Sequence[User]) -> None:
+        self.repo.save_all(items)
+
     def get_by_login(self, login: str) -> Optional[User]:
+        if REGISTRY.enabled:
+            return _scan(self.repo.get_all(), lambda u: u.login == login, "login")
         return next((u for u in self.repo.get_all() if u.login == login), None)
 
 
@@ -143,8 +400,14 @@ class AuthService(IAuthService):
             try:
                 with open(self.filepath, 'rb') as f:
                     login = pickle.load(f)
-                    return self.user_repo.get_by_login(login)
+                    user = self.user_repo.get_by_login(login)
+                    if REGISTRY.enabled:
+                        AUTH_SESSION_RESTORES.inc(result="found" if user else "unknown_login")
+                        AUTH_AUTHORIZED.set(1 if user else 0, session=os.path.basename(self.filepath))
+                    return user
             except (OSError, pickle.PickleError) as e:
+                if REGISTRY.enabled:
+                    AUTH_SESSION_ERRORS.inc(operation="load")
                 print(f"Ошибка при загрузке пользователя из {self.filepath}: {e}")
         return None
 
@@ -156,15 +419,23 @@ class AuthService(IAuthService):
             elif os.path.exists(self.filepath):
                 os.remove(self.filepath)
         except (OSError, pickle.PickleError) as e:
+            if REGISTRY.enabled:
+                AUTH_SESSION_ERRORS.inc(operation="save")
             print(f"Ошибка при сохранении сессии пользователя: {e}")
 
     def sign_in(self, user: User) -> None:
         self._current_user = user
         self._save_user()
+        if REGISTRY.enabled:
+            AUTH_SIGN_INS.inc()
+            AUTH_AUTHORIZED.set(1, session=os.path.basename(self.filepath))
 
     def sign_out(self) -> None:
         self._current_user = None
         self._save_user()
+        if REGISTRY.enabled:
+            AUTH_SIGN_OUTS.inc()
+            AUTH_AUTHORIZED.set(0, session=os.path.basename(self.filepath))
 
     @property
     def is_authorized(self) -> bool:
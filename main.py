@@ -95,63 +95,63 @@ class Vector2d:
         return cross_product * v3.x + cross_product * v3.y
 
 
-
-'''
-print("/////////////_POINTER_DEBUG_//////////////////")
-#Pointer debug
-pointer1 = Pointer2d(10,10)
-pointer2 = Pointer2d(10,10)
-print(pointer1.__check_paramerts__())
-print(pointer2.__check_paramerts__())
-print(pointer1.__equal__(pointer2))
-print(pointer1)
-print(pointer2)
-'''
-print("/////////////_POSITIONS_//////////////////")
-position_1 = Pointer2d(5,5)
-position_2 = Pointer2d(15,25)
-position_3 = Pointer2d(5,5)
-position_4 = Pointer2d(15,25)
-position_5 = Pointer2d(25,35)
-position_6 = Pointer2d(45,60)
-vector_1 = Vector2d(start = position_1,end = position_2)
-vector_2 = Vector2d(start = position_3,end = position_4)
-vector_3 = Vector2d(start = position_5,end = position_6)
-'''
-vector_1.__get_item__(0)
-vector_1.__set_item__(0,100)
-vector_1.__set_item__(1,120)
-'''
-print(vector_1.__repr__())
-print(len(vector_1))
-for value in vector_1:
-    print(value)
-print(vector_2.__abs__())
-print(vector_2.__abs__())
-print(vector_1.__equal__(vector_2))
-print("///////////////////////////////")
-print(vector_1.__repr__())
-print(vector_2.__repr__())
-print(vector_3.__repr__())
-'''
-print("////////////_MATH_OPERATION_///////////////////")
-vector_sum = vector_1 + vector_2
-print(vector_sum)
-vector_diff = vector_1 - vector_2
-print(vector_diff)
-vector_mul = vector_1 * 2
-print(vector_mul)
-vector_div = vector_1 / 2
-print(vector_div)
-'''
-print("//////////////_VECTORS_PRODUCTS_/////////////////")
-dot_result = vector_1.dot(vector_2)
-print(f"Скалярное произведение (метод инстанса): {dot_result}")
-dot_static_result = Vector2d.dot_static(vector_1, vector_2)
-print(f"Скалярное произведение (статический метод): {dot_static_result}")
-cross_result = vector_1.cross(vector_2)
-print(f"Векторное произведение (метод инстанса): {cross_result}")
-cross_static_result = Vector2d.cross_static(vector_1, vector_2)
-print(f"Векторное произведение (статический метод): {cross_static_result}")
-mixed_result = Vector2d.mixed_product(vector_1, vector_2, vector_3)
-print(f"Смешанное произведение: {mixed_result}")
\ No newline at end of file
+if __name__ == "__main__":
+    '''
+    print("/////////////_POINTER_DEBUG_//////////////////")
+    #Pointer debug
+    pointer1 = Pointer2d(10,10)
+    pointer2 = Pointer2d(10,10)
+    print(pointer1.__check_paramerts__())
+    print(pointer2.__check_paramerts__())
+    print(pointer1.__equal__(pointer2))
+    print(pointer1)
+    print(pointer2)
+    '''
+    print("/////////////_POSITIONS_//////////////////")
+    position_1 = Pointer2d(5,5)
+    position_2 = Pointer2d(15,25)
+    position_3 = Pointer2d(5,5)
+    position_4 = Pointer2d(15,25)
+    position_5 = Pointer2d(25,35)
+    position_6 = Pointer2d(45,60)
+    vector_1 = Vector2d(start = position_1,end = position_2)
+    vector_2 = Vector2d(start = position_3,end = position_4)
+    vector_3 = Vector2d(start = position_5,end = position_6)
+    '''
+    vector_1.__get_item__(0)
+    vector_1.__set_item__(0,100)
+    vector_1.__set_item__(1,120)
+    '''
+    print(vector_1.__repr__())
+    print(len(vector_1))
+    for value in vector_1:
+        print(value)
+    print(vector_2.__abs__())
+    print(vector_2.__abs__())
+    print(vector_1.__equal__(vector_2))
+    print("///////////////////////////////")
+    print(vector_1.__repr__())
+    print(vector_2.__repr__())
+    print(vector_3.__repr__())
+    '''
+    print("////////////_MATH_OPERATION_///////////////////")
+    vector_sum = vector_1 + vector_2
+    print(vector_sum)
+    vector_diff = vector_1 - vector_2
+    print(vector_diff)
+    vector_mul = vector_1 * 2
+    print(vector_mul)
+    vector_div = vector_1 / 2
+    print(vector_div)
+    '''
+    print("//////////////_VECTORS_PRODUCTS_/////////////////")
+    dot_result = vector_1.dot(vector_2)
+    print(f"Скалярное произведение (метод инстанса): {dot_result}")
+    dot_static_result = Vector2d.dot_static(vector_1, vector_2)
+    print(f"Скалярное произведение (статический метод): {dot_static_result}")
+    cross_result = vector_1.cross(vector_2)
+    print(f"Векторное произведение (метод инстанса): {cross_result}")
+    cross_static_result = Vector2d.cross_static(vector_1, vector_2)
+    print(f"Векторное произведение (статический метод): {cross_static_result}")
+    mixed_result = Vector2d.mixed_product(vector_1, vector_2, vector_3)
+    print(f"Смешанное произведение: {mixed_result}")